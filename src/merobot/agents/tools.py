@@ -6,27 +6,46 @@ from merobot.tools.base import BaseTool
 class ToolRegistry:
     def __init__(self):
         self._tools: dict[str, BaseTool] = {}
+        self._version = 0
+        self._definitions: list[dict] | None = None
 
     @property
     def tool_names(self):
         """List of registered tool names."""
         return list(self._tools.keys())
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of registered tools changes."""
+        return self._version
+
+    def _invalidate(self):
+        self._version += 1
+        self._definitions = None
+
     def register(self, tool: BaseTool):
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered.")
         self._tools[tool.name] = tool
+        self._invalidate()
 
     def unregister(self, name: str):
         if name in self._tools:
             del self._tools[name]
+            self._invalidate()
 
     def get_tool(self, name: str) -> BaseTool | None:
         return self._tools.get(name)
 
     def get_definitions(self) -> list[dict]:
-        """Get list of tool definitions for LLM function calls."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get list of tool definitions for LLM function calls.
+
+        Schemas are built once and reused until a tool is registered or
+        unregistered. Callers must not mutate the returned list.
+        """
+        if self._definitions is None:
+            self._definitions = [tool.to_schema() for tool in self._tools.values()]
+        return self._definitions
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         tool = self.get_tool(name)
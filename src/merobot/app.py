@@ -15,6 +15,7 @@ from merobot.handler.handler import CommunicationHandler
 from merobot.handler.message_bus import MessageBus
 from merobot.handler.session.session import SessionManager
 from merobot.providers.llm import LlmApiProvider
+from merobot.tools import close_http_client
 
 
 class Application:
@@ -84,6 +85,7 @@ class Application:
             pass
 
         await self.handler.stop()
+        await close_http_client()
         logger.info("MeroBot stopped.")
 
     def _signal_handler(self) -> None:
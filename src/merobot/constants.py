@@ -18,6 +18,8 @@ SCRAPE_TIMEOUT = 20.0
 SCRAPE_DEFAULT_MAX_LENGTH = 5_000
 SCRAPE_ABSOLUTE_MAX_LENGTH = 20_000
 SCRAPE_MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 5 MB max download
+SCRAPE_CACHE_TTL = 300.0                     # seconds a scraped result is reused
+SCRAPE_CACHE_MAX_ENTRIES = 128
 SCRAPE_STRIP_TAGS = [
     "script", "style", "noscript", "iframe", "svg",
     "nav", "footer", "header", "aside", "form",
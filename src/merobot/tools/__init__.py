@@ -1,5 +1,6 @@
 """Agent tools package."""
 
+from merobot.tools._http import close_http_client
 from merobot.tools.base import BaseTool
 from merobot.tools.code_executor import CodeExecutorTool
 from merobot.tools.date_time import DateTimeTool
@@ -19,4 +20,5 @@ __all__ = [
     "SubAgentTool",
     "WebScrapeTool",
     "WebSearchTool",
+    "close_http_client",
 ]
@@ -0,0 +1,99 @@
+"""Shared HTTP client for the web tools.
+
+A single pooled ``httpx.AsyncClient`` lets repeated web_search /
+web_scrape calls reuse TCP + TLS connections instead of handshaking
+on every request. Per-request headers and timeouts are passed at the
+call site.
+"""
+
+import asyncio
+import ssl
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+from merobot.constants import DEFAULT_USER_AGENT
+
+# Built once and reused by every client we create. truststore (the
+# "truststore" extra) verifies against the OS certificate store; without
+# it, fall back to httpx's certifi-based default context.
+try:
+    import truststore
+
+    _SSL_CONTEXT: ssl.SSLContext = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+except ImportError:
+    _SSL_CONTEXT = httpx.create_ssl_context()
+
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Concurrency caps for tool requests: overall, and per remote host so a
+# burst of scrapes against one site doesn't hammer it or starve others.
+_MAX_CONCURRENT_REQUESTS = 64
+_MAX_REQUESTS_PER_HOST = 6
+
+
+class _HostSlots:
+    """A host's semaphore plus the number of requests holding or awaiting it."""
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(_MAX_REQUESTS_PER_HOST)
+        self.users = 0
+
+
+_global_slots = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+# Only hosts with requests in flight have an entry; idle hosts are dropped.
+_host_slots: dict[str, _HostSlots] = {}
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            follow_redirects=True,
+            max_redirects=5,
+            limits=_LIMITS,
+            verify=_SSL_CONTEXT,
+        )
+    return _client
+
+
+@asynccontextmanager
+async def request_slot(url: str) -> AsyncIterator[None]:
+    """Hold a per-host and a global concurrency slot for one request.
+
+    The host slot is taken first, so requests queued behind a busy host
+    don't sit on global slots that requests to other hosts need.
+    """
+    host = urlsplit(url).netloc
+    slots = _host_slots.get(host)
+    if slots is None:
+        slots = _host_slots[host] = _HostSlots()
+
+    slots.users += 1
+    try:
+        async with slots.semaphore, _global_slots:
+            yield
+    finally:
+        slots.users -= 1
+        if not slots.users:
+            del _host_slots[host]
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections (call on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,5 +1,7 @@
 """Sandboxed file read/write tools."""
 
+import asyncio
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -83,9 +85,15 @@ class FileReadTool(BaseTool):
         if not user_path:
             return "Error: 'path' parameter is required."
 
-        sandbox = _get_sandbox_root()
         max_bytes = max(1, min(TOOL_MAX_READ_BYTES, max_bytes))
 
+        # Filesystem access blocks; keep it off the event loop.
+        return await asyncio.to_thread(self._read, user_path, max_bytes)
+
+    def _read(self, user_path: str, max_bytes: int) -> str:
+        """Resolve and read the file (runs in a worker thread)."""
+        sandbox = _get_sandbox_root()
+
         if not sandbox.exists():
             return f"Error: Workspace directory '{sandbox}' does not exist. Create it first."
 
@@ -94,18 +102,21 @@ class FileReadTool(BaseTool):
             return result
         filepath: Path = result
 
-        if not filepath.exists():
+        # One stat() answers existence, file type and size.
+        try:
+            st = filepath.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return f"Error: File not found — '{user_path}' (resolved: {filepath})"
 
-        if not filepath.is_file():
-            if filepath.is_dir():
+        if not stat.S_ISREG(st.st_mode):
+            if stat.S_ISDIR(st.st_mode):
                 return self._list_directory(filepath, sandbox)
             return f"Error: '{user_path}' is not a regular file."
 
         logger.info(f"File read: {filepath}")
 
         try:
-            size = filepath.stat().st_size
+            size = st.st_size
             if size > max_bytes:
                 content = filepath.read_text(encoding="utf-8", errors="replace")[:max_bytes]
                 return (
@@ -199,41 +210,48 @@ class FileWriteTool(BaseTool):
         if not user_path:
             return "Error: 'path' parameter is required."
 
-        sandbox = _get_sandbox_root()
-
-        content_bytes = len(content.encode("utf-8"))
+        data = content.encode("utf-8")
+        content_bytes = len(data)
         if content_bytes > TOOL_MAX_WRITE_BYTES:
             return (
                 f"Error: Content is {content_bytes:,} bytes, "
                 f"exceeds maximum of {TOOL_MAX_WRITE_BYTES:,} bytes (5 MB)."
             )
 
-        sandbox.mkdir(parents=True, exist_ok=True)
+        # Filesystem access blocks; keep it off the event loop.
+        return await asyncio.to_thread(self._write, user_path, data, mode)
+
+    def _write(self, user_path: str, data: bytes, mode: str) -> str:
+        """Resolve the path and write the encoded content (runs in a worker thread)."""
+        sandbox = _get_sandbox_root()
 
         result = _resolve_safe_path(user_path, sandbox)
         if isinstance(result, str):
             return result
         filepath: Path = result
+        if filepath == sandbox:
+            return f"Error: '{user_path}' is the workspace directory, not a file."
 
         logger.info(f"File write ({mode}): {filepath}")
 
         try:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            # The sandbox is an ancestor of filepath, so this also creates it.
+            # Skip the mkdir syscalls when the directory is already there.
+            if not filepath.parent.is_dir():
+                filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            if mode == "append":
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(content)
-                action = "Appended to"
-            else:
-                filepath.write_text(content, encoding="utf-8")
-                action = "Wrote"
+            # Content is already encoded; write the bytes in a single call
+            # instead of going through a TextIOWrapper.
+            with open(filepath, "ab" if mode == "append" else "wb") as f:
+                f.write(data)
+            action = "Appended to" if mode == "append" else "Wrote"
 
             final_size = filepath.stat().st_size
 
             return (
                 f"✅ {action} file successfully.\n"
                 f"**Path**: {filepath.relative_to(sandbox)}\n"
-                f"**Written**: {content_bytes:,} bytes\n"
+                f"**Written**: {len(data):,} bytes\n"
                 f"**Total size**: {final_size:,} bytes"
             )
         except PermissionError:
@@ -6,9 +6,8 @@ querying structured data. The DB lives in the workspace directory.
 
 from __future__ import annotations
 
-import sqlite3
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -16,8 +15,13 @@ from merobot.config import get_config
 from merobot.constants import SQLITE_DB_FILENAME
 from merobot.tools.base import BaseTool
 
+if TYPE_CHECKING:
+    import sqlite3
+
 # Statements that modify data (need commit)
 _WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER", "REPLACE")
+# Only the leading keyword matters; no need to upper-case the whole query
+_PREFIX_LEN = max(len(p) for p in _WRITE_PREFIXES)
 
 
 class SQLiteQueryTool(BaseTool):
@@ -76,12 +80,17 @@ class SQLiteQueryTool(BaseTool):
 
         logger.info(f"SQLite query: {query[:100]}")
 
+        # Imported on first use so startup doesn't load the native library
+        # for a tool that may never be called.
+        import sqlite3
+
         try:
             conn = sqlite3.connect(str(db_path))
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
-            is_write = query.strip().upper().startswith(_WRITE_PREFIXES)
+            head = query[:_PREFIX_LEN].upper()
+            is_write = head.startswith(_WRITE_PREFIXES)
 
             cursor.execute(query, params)
 
@@ -92,9 +101,9 @@ class SQLiteQueryTool(BaseTool):
                     f"✅ Query executed successfully.\n"
                     f"**Rows affected**: {affected}"
                 )
-                if query.strip().upper().startswith("CREATE"):
+                if head.startswith("CREATE"):
                     result = "✅ Table created successfully."
-                elif query.strip().upper().startswith("DROP"):
+                elif head.startswith("DROP"):
                     result = "✅ Table dropped successfully."
             else:
                 rows = cursor.fetchall()
@@ -7,6 +7,7 @@ loop and returns the final text response as the tool result.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
@@ -49,6 +50,8 @@ class SubAgentTool(BaseTool):
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = temperature
+        self._tool_defs: list[dict] = []
+        self._tool_defs_version: int | None = None
 
     @property
     def name(self) -> str:
@@ -102,11 +105,7 @@ class SubAgentTool(BaseTool):
             messages.append({"role": "user", "content": f"Context: {context}"})
         messages.append({"role": "user", "content": task})
 
-        # Get tool definitions excluding this tool (prevent recursion)
-        tool_defs = [
-            t for t in self._tool_registry.get_definitions()
-            if t["function"]["name"] != self.name
-        ]
+        tool_defs = self._get_tool_defs()
 
         # Mini tool loop
         for iteration in range(MAX_SUB_AGENT_ITERATIONS):
@@ -136,17 +135,25 @@ class SubAgentTool(BaseTool):
                     "type": "function",
                     "function": {
                         "name": tc.name,
-                        "arguments": json.dumps(tc.arguments),
+                        "arguments": json.dumps(tc.arguments, ensure_ascii=False),
                     },
                 }
                 for tc in llm_response.tool_calls
             ]
             messages.append(assistant_msg)
 
-            for tc in llm_response.tool_calls:
-                logger.info(f"Sub-agent executing tool: {tc.name}")
-                result = await self._tool_registry.execute(tc.name, tc.arguments)
+            # Run the requested tools concurrently; gather keeps call order.
+            # ToolRegistry.execute never raises, so no return_exceptions needed.
+            logger.info(
+                "Sub-agent executing tools: "
+                + ", ".join(tc.name for tc in llm_response.tool_calls)
+            )
+            results = await asyncio.gather(*(
+                self._tool_registry.execute(tc.name, tc.arguments)
+                for tc in llm_response.tool_calls
+            ))
 
+            for tc, result in zip(llm_response.tool_calls, results):
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tc.id,
@@ -158,3 +165,17 @@ class SubAgentTool(BaseTool):
         logger.warning("Sub-agent max iterations reached")
         content = llm_response.content if llm_response else None
         return content or "Sub-agent reached its iteration limit without a final answer."
+
+    def _get_tool_defs(self) -> list[dict]:
+        """Tool definitions excluding this tool (prevents recursion).
+
+        Cached until the registry's tool set changes.
+        """
+        version = self._tool_registry.version
+        if self._tool_defs_version != version:
+            self._tool_defs = [
+                t for t in self._tool_registry.get_definitions()
+                if t["function"]["name"] != self.name
+            ]
+            self._tool_defs_version = version
+        return self._tool_defs
@@ -1,21 +1,60 @@
 """Web scraping tool using httpx + BeautifulSoup."""
 
+import asyncio
+import re
+import time
+from collections import OrderedDict
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
 from merobot.constants import (
     DEFAULT_USER_AGENT,
     SCRAPE_ABSOLUTE_MAX_LENGTH,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_CACHE_TTL,
     SCRAPE_DEFAULT_MAX_LENGTH,
+    SCRAPE_MAX_RESPONSE_BYTES,
     SCRAPE_STRIP_TAGS,
     SCRAPE_TIMEOUT,
 )
+from merobot.tools._http import get_http_client, request_slot
 from merobot.tools.base import BaseTool
 
+# lxml builds the tree in C and is several times faster than the pure-Python
+# html.parser; fall back to the stdlib parser without the "fast" extra.
+try:
+    import lxml
+
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+# selectolax (Lexbor, in C) handles the no-selector path without building
+# BeautifulSoup's Python-side tree — about 25x faster on large pages. The
+# selector path stays on BeautifulSoup for soupsieve's selector support.
+# Also part of the "fast" extra.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_STRIP_TAGS = frozenset(SCRAPE_STRIP_TAGS)
+
+# A line break plus any whitespace around it (trailing spaces, blank lines,
+# next line's indent) — collapsing these to "\n" strips every line and
+# drops empty ones in a single C-level pass. The lookbehind only lets a match
+# start at the beginning of a whitespace run; a plain \s*\n\s* rescans long
+# newline-free runs from every position, which is quadratic.
+_LINE_BREAK_RE = re.compile(r"(?<![^\S\n])[^\S\n]*\n\s*")
+
+# (url, max_length, selector) — everything that shapes a scrape result
+_CacheKey = tuple[str, int, str | None]
+
 _HEADERS = {
     "User-Agent": DEFAULT_USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -29,6 +68,10 @@ class WebScrapeTool(BaseTool):
     Strips scripts, styles, navigation, and other non-content elements.
     """
 
+    def __init__(self) -> None:
+        # LRU-ordered scrape results: key -> (expires_at, result)
+        self._cache: OrderedDict[_CacheKey, tuple[float, str]] = OrderedDict()
+
     @property
     def name(self) -> str:
         return "web_scrape"
@@ -90,6 +133,20 @@ class WebScrapeTool(BaseTool):
 
         max_length = max(100, min(SCRAPE_ABSOLUTE_MAX_LENGTH, max_length))
 
+        # Reject a bad selector before spending a network round-trip on it.
+        # soupsieve caches compiled selectors, so the later select() reuses it.
+        if selector:
+            try:
+                soupsieve.compile(selector)
+            except soupsieve.SelectorSyntaxError as e:
+                return f"Error: Invalid CSS selector {selector!r} — {e}"
+
+        cache_key = (url, max_length, selector)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Web scrape cache hit: {url!r}")
+            return cached
+
         logger.info(f"Web scrape: {url!r} (max_length={max_length}, selector={selector!r})")
 
         try:
@@ -104,31 +161,97 @@ class WebScrapeTool(BaseTool):
             logger.error(f"Web scrape unexpected error: {e}")
             return f"Error: Unexpected error — {type(e).__name__}: {e}"
 
-        return self._extract_content(html, url, max_length, selector)
+        # Parsing is CPU-bound; run it in a worker thread so other coroutines
+        # get a turn between its Python steps. The thread still holds the GIL
+        # through any single C call (a regex pass), so those must stay linear.
+        if selector:
+            result = await asyncio.to_thread(
+                self._extract_with_selector, html, url, max_length, selector
+            )
+        else:
+            result = await asyncio.to_thread(
+                self._extract_full, html, url, max_length
+            )
+        self._cache_put(cache_key, result)
+        return result
+
+    def _cache_get(self, key: _CacheKey) -> str | None:
+        """Return a cached result that hasn't expired, refreshing its LRU position."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: _CacheKey, result: str) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._cache[key] = (time.monotonic() + SCRAPE_CACHE_TTL, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > SCRAPE_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
     async def _fetch_page(self, url: str) -> str:
-        """Fetch HTML content from URL."""
-        async with httpx.AsyncClient(
-            headers=_HEADERS,
-            timeout=SCRAPE_TIMEOUT,
-            follow_redirects=True,
-            max_redirects=5,
-            verify=False,
-        ) as client:
-            response = await client.get(url)
+        """Fetch HTML content from URL, reading at most SCRAPE_MAX_RESPONSE_BYTES."""
+        client = get_http_client()
+        async with request_slot(url), client.stream(
+            "GET", url, headers=_HEADERS, timeout=SCRAPE_TIMEOUT
+        ) as response:
             response.raise_for_status()
 
             content_type = response.headers.get("content-type", "")
             if "text/html" not in content_type and "text/plain" not in content_type:
                 raise ValueError(f"Unsupported content type: {content_type}")
 
-            return response.text
+            # Stream the body and stop at the cap so a huge page can't be
+            # buffered (and later parsed) in full.
+            chunks: list[bytes] = []
+            remaining = SCRAPE_MAX_RESPONSE_BYTES
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk[:remaining])
+                remaining -= len(chunk)
+                if remaining <= 0:
+                    logger.debug(f"Web scrape: response capped for {url!r}")
+                    break
+
+            return b"".join(chunks).decode(response.encoding, errors="replace")
+
+    def _extract_full(self, html: str, url: str, max_length: int) -> str:
+        """Fast path for the common no-selector call: text of the whole body."""
+        if LexborHTMLParser is not None:
+            title, meta_desc, content_text = self._parse_lexbor(html)
+        else:
+            _, root, title, meta_desc = self._parse(html)
+            content_text = root.get_text(separator="\n")
+        return self._build_report(content_text, title, meta_desc, url, max_length)
 
-    def _extract_content(
-        self, html: str, url: str, max_length: int, selector: str | None
+    def _extract_with_selector(
+        self, html: str, url: str, max_length: int, selector: str
     ) -> str:
-        """Parse HTML and extract readable text."""
-        soup = BeautifulSoup(html, "html.parser")
+        """Text of the elements matching selector, falling back to the whole body."""
+        soup, root, title, meta_desc = self._parse(html, strip_head=True)
+        content_text = "\n\n".join(
+            el.get_text(separator="\n")
+            for el in soup.select(selector)
+        )
+        if not content_text or content_text.isspace():
+            content_text = root.get_text(separator="\n")
+        return self._build_report(content_text, title, meta_desc, url, max_length)
+
+    @staticmethod
+    def _parse(
+        html: str, strip_head: bool = False
+    ) -> tuple[BeautifulSoup, Tag, str, str]:
+        """Parse HTML, read title/description and strip non-content tags.
+
+        Returns (soup, root, title, meta_desc) where root is <body>, or the
+        whole document when there is none. Non-content tags are stripped
+        from root only, unless strip_head is set.
+        """
+        soup = BeautifulSoup(html, _PARSER)
 
         title = soup.title.get_text(strip=True) if soup.title else ""
         meta_desc = ""
@@ -136,40 +259,71 @@ class WebScrapeTool(BaseTool):
         if meta_tag and meta_tag.get("content"):
             meta_desc = meta_tag["content"].strip()
 
-        for tag_name in SCRAPE_STRIP_TAGS:
-            for tag in soup.find_all(tag_name):
+        # Full-page text only ever comes from <body> (or the whole document if
+        # there is none), so look it up once and leave <head> alone. A CSS
+        # selector can match <head> content too, so that path strips it all.
+        body = soup.body
+        root = body if body is not None else soup
+        scope = soup if strip_head else root
+
+        # Collect strip tags in one plain walk (strings have name None), then
+        # remove them. A tag nested inside an earlier match is already gone.
+        for tag in [el for el in scope.descendants if el.name in _STRIP_TAGS]:
+            if not tag.decomposed:
                 tag.decompose()
 
-        content_text = ""
-        if selector:
-            selected = soup.select(selector)
-            if selected:
-                content_text = "\n\n".join(
-                    el.get_text(separator="\n", strip=True) for el in selected
-                )
-
-        if not content_text:
-            body = soup.find("body")
-            target = body if body else soup
-            content_text = target.get_text(separator="\n", strip=True)
-
-        lines = [line.strip() for line in content_text.splitlines()]
-        lines = [line for line in lines if line]
-        content_text = "\n".join(lines)
-
-        truncated = False
-        if len(content_text) > max_length:
+        return soup, root, title, meta_desc
+
+    @staticmethod
+    def _parse_lexbor(html: str) -> tuple[str, str, str]:
+        """selectolax equivalent of _parse plus body text.
+
+        Returns (title, meta_desc, text).
+        """
+        tree = LexborHTMLParser(html)
+
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else ""
+        meta_node = tree.css_first('meta[name="description"]')
+        meta_desc = ""
+        if meta_node:
+            meta_desc = (meta_node.attributes.get("content") or "").strip()
+
+        tree.strip_tags(list(_STRIP_TAGS))
+        root = tree.body or tree.root
+        return title, meta_desc, root.text(separator="\n")
+
+    @staticmethod
+    def _build_report(
+        content_text: str, title: str, meta_desc: str, url: str, max_length: int
+    ) -> str:
+        """Normalize and truncate the extracted text and format the result."""
+        # Text is extracted without strip=True: per-string stripping happens
+        # in the _LINE_BREAK_RE pass, which handles the whole text in C.
+        # Whitespace cleanup only ever shrinks the text, so there is no point
+        # normalizing megabytes of it to keep max_length characters. Normalize
+        # a bounded prefix instead, widening it while it comes up short —
+        # pretty-printed pages can be mostly indentation.
+        limit = max_length * 4
+        while True:
+            normalized = _LINE_BREAK_RE.sub("\n", content_text[:limit]).strip()
+            if len(normalized) > max_length or limit >= len(content_text):
+                break
+            limit *= 4
+        content_text = normalized
+
+        truncated = len(content_text) > max_length
+        if truncated:
             content_text = content_text[:max_length]
-            truncated = True
-
-        parts = [f"## Scraped: {title or url}\n"]
-        if title:
-            parts.append(f"**Title**: {title}")
-        parts.append(f"**URL**: {url}")
-        if meta_desc:
-            parts.append(f"**Description**: {meta_desc}")
-        parts.append(f"**Length**: {len(content_text)} chars")
-        parts.append(f"\n---\n\n{content_text}")
+
+        parts = [
+            f"## Scraped: {title or url}\n",
+            *([f"**Title**: {title}"] if title else ()),
+            f"**URL**: {url}",
+            *([f"**Description**: {meta_desc}"] if meta_desc else ()),
+            f"**Length**: {len(content_text)} chars",
+            f"\n---\n\n{content_text}",
+        ]
 
         if truncated:
             parts.append(f"\n\n*[...truncated at {max_length} characters]*")
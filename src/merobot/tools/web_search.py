@@ -1,33 +1,69 @@
 """Web search tool using DuckDuckGo HTML endpoint."""
 
 import re
+from collections.abc import Iterator
 from html import unescape
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus
 
 import httpx
 from loguru import logger
 
 from merobot.constants import DEFAULT_USER_AGENT, SEARCH_DDG_URL, SEARCH_TIMEOUT
+from merobot.tools._http import get_http_client, request_slot
 from merobot.tools.base import BaseTool
 
 _HEADERS = {"User-Agent": DEFAULT_USER_AGENT}
 
-# Regex patterns to extract results from DDG HTML
-_RESULT_BLOCK = re.compile(
-    r'<a\s+rel="nofollow"\s+class="result__a"\s+href="([^"]+)"[^>]*>(.*?)</a>',
-    re.DOTALL,
-)
-_SNIPPET_BLOCK = re.compile(
-    r'<a\s+class="result__snippet"[^>]*>(.*?)</a>',
-    re.DOTALL,
-)
-_TAG_RE = re.compile(r"<[^>]+>")
+# DDG renders result rows with fixed attribute order, so plain substring
+# anchors are enough to find result title links and snippets.
+_RESULT_PREFIX = '<a rel="nofollow" class="result__a" href="'
+_SNIPPET_PREFIX = '<a class="result__snippet"'
+# A tag (dropped) or a character reference (decoded), handled in one pass.
+# The semicolon is optional because unescape also decodes legacy forms like "&amp".
+_CLEAN_RE = re.compile(r"<[^>]+>|&[#\w]+;?")
+# Target URL inside DDG's redirect link (//duckduckgo.com/l/?uddg=...&rut=...)
+_UDDG_RE = re.compile(r"[?&]uddg=([^&]+)")
+
+
+def _clean_match(match: re.Match[str]) -> str:
+    token = match.group()
+    return "" if token[0] == "<" else unescape(token)
 
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    return unescape(_TAG_RE.sub("", text)).strip()
+    return _CLEAN_RE.sub(_clean_match, text).strip()
+
+
+def _iter_results(html: str) -> Iterator[tuple[str | None, str]]:
+    """Yield (href, inner_html) for result links and (None, inner_html) for
+    snippets, in document order, using a linear str.find scan."""
+    next_result = html.find(_RESULT_PREFIX)
+    next_snippet = html.find(_SNIPPET_PREFIX)
+
+    while next_result != -1 or next_snippet != -1:
+        if next_snippet == -1 or -1 < next_result < next_snippet:
+            href_start = next_result + len(_RESULT_PREFIX)
+            attrs_start = html.find('"', href_start)
+            if attrs_start == -1:
+                return
+            href: str | None = html[href_start:attrs_start]
+        else:
+            href = None
+            attrs_start = next_snippet + len(_SNIPPET_PREFIX)
+
+        inner_start = html.find(">", attrs_start) + 1
+        inner_end = html.find("</a>", inner_start)
+        if inner_start == 0 or inner_end == -1:
+            return
+        yield href, html[inner_start:inner_end]
+
+        pos = inner_end + len("</a>")
+        if next_result != -1 and next_result < pos:
+            next_result = html.find(_RESULT_PREFIX, pos)
+        if next_snippet != -1 and next_snippet < pos:
+            next_snippet = html.find(_SNIPPET_PREFIX, pos)
 
 
 class WebSearchTool(BaseTool):
@@ -103,36 +139,39 @@ class WebSearchTool(BaseTool):
         self, query: str, max_results: int
     ) -> list[dict[str, str]]:
         """Fetch search results from DuckDuckGo HTML endpoint."""
-        async with httpx.AsyncClient(
-            headers=_HEADERS,
-            timeout=SEARCH_TIMEOUT,
-            follow_redirects=True,
-        ) as client:
-            response = await client.post(
+        async with request_slot(SEARCH_DDG_URL):
+            response = await get_http_client().post(
                 SEARCH_DDG_URL,
                 data={"q": query, "b": ""},
+                headers=_HEADERS,
+                timeout=SEARCH_TIMEOUT,
             )
-            response.raise_for_status()
+        response.raise_for_status()
 
         html = response.text
-        titles_urls = _RESULT_BLOCK.findall(html)
-        snippets = _SNIPPET_BLOCK.findall(html)
 
+        # A snippet belongs to the result title before it; pairing them in
+        # order keeps them aligned when a result has no snippet, and lets us
+        # stop scanning once we have enough results.
         results: list[dict[str, str]] = []
-        for i, (url, raw_title) in enumerate(titles_urls[:max_results]):
-            title = _strip_html(raw_title)
-            snippet = _strip_html(snippets[i]) if i < len(snippets) else ""
+        for url, inner in _iter_results(html):
+            if url is None:
+                if results and not results[-1]["snippet"]:
+                    results[-1]["snippet"] = _strip_html(inner)
+                continue
+
+            if len(results) == max_results:
+                break
 
             # DDG wraps URLs in a redirect — extract the actual URL
-            if "uddg=" in url:
-                parsed = urlparse(url)
-                qs = parse_qs(parsed.query)
-                url = qs.get("uddg", [url])[0]
+            uddg = _UDDG_RE.search(url)
+            if uddg:
+                url = unquote_plus(uddg.group(1))
 
             results.append({
-                "title": title,
+                "title": _strip_html(inner),
                 "url": url,
-                "snippet": snippet,
+                "snippet": "",
             })
 
         return results
@@ -143,10 +182,9 @@ class WebSearchTool(BaseTool):
         lines = [f"## Search results for: {query}\n"]
 
         for i, r in enumerate(results, 1):
-            lines.append(f"### {i}. {r['title']}")
-            lines.append(f"**URL**: {r['url']}")
+            lines.extend((f"### {i}. {r['title']}", f"**URL**: {r['url']}"))
             if r["snippet"]:
-                lines.append(f"{r['snippet']}")
+                lines.append(r["snippet"])
             lines.append("")
 
         return "\n".join(lines)
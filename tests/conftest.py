@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def telegram_app_factory():
+    """Return a factory that wires a fresh mocked Telegram Application.
+
+    Calling ``factory(MockApplication)`` sets up the
+    ``Application.builder().token(...).build()`` chain on the patched class
+    and returns ``(builder, app_instance)`` for assertions.
+    """
+    from telegram import Bot
+    from telegram.ext import Application, Updater
+
+    def factory(mock_application: MagicMock) -> tuple[MagicMock, AsyncMock]:
+        app_instance = AsyncMock(spec=Application)
+        # bot/updater are properties, which spec'd mocks don't make async.
+        app_instance.bot = AsyncMock(spec=Bot)
+        app_instance.updater = AsyncMock(spec=Updater)
+
+        builder = MagicMock()
+        builder.token.return_value = builder
+        builder.build.return_value = app_instance
+        mock_application.builder.return_value = builder
+        return builder, app_instance
+
+    return factory
@@ -6,7 +6,7 @@ Tests the consume → LLM → tool loop → respond pipeline with mocked LLM.
 import asyncio
 import json
 import time
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -22,6 +22,32 @@ from merobot.providers.llm.base import LLMResponse, ToolCallRequests
 # ---------------------------------------------------------------------------
 
 
+# Built once at import: the config is read-only for AgentLoop, so every
+# test can share it. Plain MagicMock — none of these attributes are awaited.
+_DEFAULTS = MagicMock(
+    provider="litellm",
+    model="gpt-3.5-turbo",
+    max_tokens=2048,
+    temperature=0.7,
+)
+_CONFIG = MagicMock()
+_CONFIG.agent.defaults = _DEFAULTS
+_CONFIG.providers = {
+    "litellm": ProviderConfig(
+        name="litellm", slug="litellm",
+        api_key="test-key", enabled=True,
+    )
+}
+
+
+def _make_agent_loop(bus: MessageBus, session: SessionManager) -> AgentLoop:
+    """Return a fresh AgentLoop wired to the shared config stub."""
+    with patch("merobot.agents.loop.get_config", return_value=_CONFIG):
+        return AgentLoop(message_bus=bus, session_manager=session, llm=MagicMock())
+
+
+# bus and session stay function-scoped: tests publish to the bus queues and
+# append to session history, so sharing them would leak state between tests.
 @pytest.fixture
 def bus():
     return MessageBus()
@@ -34,26 +60,7 @@ def session():
 
 @pytest.fixture
 def agent_loop(bus, session):
-    with patch("merobot.agents.loop.get_config") as mock_config:
-        # Minimal config stub
-        defaults = AsyncMock()
-        defaults.provider = "litellm"
-        defaults.model = "gpt-3.5-turbo"
-        defaults.max_tokens = 2048
-        defaults.temperature = 0.7
-
-        config = AsyncMock()
-        config.agent.defaults = defaults
-        config.providers = {
-            "litellm": ProviderConfig(
-                name="litellm", slug="litellm",
-                api_key="test-key", enabled=True,
-            )
-        }
-        mock_config.return_value = config
-
-        loop = AgentLoop(message_bus=bus, session_manager=session)
-        return loop
+    return _make_agent_loop(bus, session)
 
 
 def _make_inbound(text: str = "hello", chat_id: str = "42") -> InboundMessage:
@@ -0,0 +1,78 @@
+"""Unit tests for the shared HTTP helpers."""
+
+import asyncio
+
+import pytest
+
+from merobot.tools import _http
+from merobot.tools._http import request_slot
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    """One request per host, two overall, on semaphores bound to this test's loop."""
+    monkeypatch.setattr(_http, "_MAX_REQUESTS_PER_HOST", 1)
+    monkeypatch.setattr(_http, "_global_slots", asyncio.Semaphore(2))
+    monkeypatch.setattr(_http, "_host_slots", {})
+
+
+async def _hold(url: str, release: asyncio.Event) -> None:
+    async with request_slot(url):
+        await release.wait()
+
+
+class TestRequestSlot:
+    @pytest.mark.asyncio
+    async def test_busy_host_does_not_starve_other_hosts(self, small_limits):
+        release = asyncio.Event()
+        busy = [
+            asyncio.create_task(_hold("https://slow.example/", release))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        try:
+            # Queued slow.example requests must not hold the global slots.
+            async with asyncio.timeout(1):
+                async with request_slot("https://idle.example/"):
+                    pass
+        finally:
+            release.set()
+            await asyncio.gather(*busy)
+
+    @pytest.mark.asyncio
+    async def test_idle_hosts_are_evicted(self, small_limits):
+        release = asyncio.Event()
+        task = asyncio.create_task(_hold("https://a.example/x", release))
+        await asyncio.sleep(0)
+
+        assert set(_http._host_slots) == {"a.example"}
+
+        release.set()
+        await task
+        async with request_slot("https://b.example/"):
+            pass
+
+        assert _http._host_slots == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_evicted(self, small_limits):
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold("https://a.example/", release))
+        waiter = asyncio.create_task(_hold("https://a.example/", release))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        await holder
+
+        assert _http._host_slots == {}
+
+
+class TestSSLContext:
+    def test_truststore_used_when_installed(self):
+        truststore = pytest.importorskip("truststore")
+
+        assert isinstance(_http._SSL_CONTEXT, truststore.SSLContext)
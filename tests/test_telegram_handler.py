@@ -4,13 +4,17 @@ The channel uses BaseChannelHandler._publish_inbound() to push messages
 directly to the bus. No receive_message() or internal queue.
 """
 
-import asyncio
+import re
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from merobot.handler.channels.telegram import TelegramChannelHandler
-from merobot.handler.messages import OutboundMessage
+# Skip (rather than error) at collection when python-telegram-bot is missing.
+telegram = pytest.importorskip("telegram")
+
+from merobot.handler.channels.telegram import TelegramChannelHandler  # noqa: E402
+from merobot.handler.messages import OutboundMessage  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -20,10 +24,9 @@ from merobot.handler.messages import OutboundMessage
 @pytest.fixture
 def mock_bus():
     """A lightweight mock that quacks like MessageBus."""
-    bus = AsyncMock()
-    bus.publish_inbound = AsyncMock()
-    bus.subscribe_outbound = AsyncMock()
-    return bus
+    # Children of an AsyncMock (publish_inbound, subscribe_outbound) are
+    # already AsyncMocks, so nothing needs to be pre-assigned.
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -32,39 +35,55 @@ def handler(mock_bus):
     return TelegramChannelHandler(bus=mock_bus, token="TEST_TOKEN_123")
 
 
+@pytest.fixture(scope="class")
+def application_cls():
+    """Patch the handler's Application once for a whole test class."""
+    with patch("merobot.handler.channels.telegram.Application") as app_cls:
+        yield app_cls
+
+
+@pytest.fixture
+def mock_application(application_cls, telegram_app_factory):
+    """Reset the patched Application and return a fresh (builder, app_instance)."""
+    application_cls.reset_mock()
+    return telegram_app_factory(application_cls)
+
+
 # ---------------------------------------------------------------------------
 # Helpers to build Telegram-like objects
 # ---------------------------------------------------------------------------
 
+# Message timestamp shared by every fake update; tests never inspect it.
+_NOW = datetime.now(tz=timezone.utc)
+
+# Error raised by send_message/start_typing before connect().
+_NOT_CONNECTED = re.compile("not connected")
+
 
 def _make_telegram_update(text="hello", chat_id=42, user_id=7, message_id=1):
     """Create a minimal mock that looks like ``telegram.Update``."""
-    user = MagicMock()
-    user.id = user_id
-    user.first_name = "Test"
-    user.username = "testuser"
-
-    chat = MagicMock()
-    chat.type = "private"
-
-    from datetime import datetime, timezone
-
-    msg = MagicMock()
-    msg.text = text
-    msg.chat_id = chat_id
-    msg.message_id = message_id
-    msg.from_user = user
-    msg.chat = chat
-    msg.date = datetime.now(tz=timezone.utc)
-    msg.photo = None
-    msg.document = None
-    msg.video = None
-    msg.audio = None
-    msg.voice = None
-
-    update = MagicMock()
-    update.message = msg
-    return update
+    user = MagicMock(id=user_id, first_name="Test", username="testuser")
+    msg = MagicMock(
+        text=text,
+        chat_id=chat_id,
+        message_id=message_id,
+        from_user=user,
+        chat=MagicMock(type="private"),
+        date=_NOW,
+        photo=None,
+        document=None,
+        video=None,
+        audio=None,
+        voice=None,
+    )
+    return MagicMock(message=msg)
+
+
+def _blank_media_msg(**overrides):
+    """Create a mock message with every media attribute unset, except overrides."""
+    attrs = dict(photo=None, document=None, video=None, audio=None, voice=None)
+    attrs.update(overrides)
+    return MagicMock(**attrs)
 
 
 # ---------------------------------------------------------------------------
@@ -76,17 +95,8 @@ class TestConnect:
     """Verify the connect lifecycle."""
 
     @pytest.mark.asyncio
-    @patch("merobot.handler.channels.telegram.Application")
-    async def test_connect_starts_polling(self, MockApplication, handler):
-        app_instance = AsyncMock()
-        app_instance.bot = AsyncMock()
-        app_instance.updater = AsyncMock()
-        app_instance.updater.start_polling = AsyncMock()
-
-        builder = MagicMock()
-        builder.token.return_value = builder
-        builder.build.return_value = app_instance
-        MockApplication.builder.return_value = builder
+    async def test_connect_starts_polling(self, handler, mock_application):
+        builder, app_instance = mock_application
 
         await handler.connect()
 
@@ -94,21 +104,11 @@ class TestConnect:
         app_instance.initialize.assert_awaited_once()
         app_instance.start.assert_awaited_once()
         app_instance.updater.start_polling.assert_awaited_once()
-        assert handler._connected is True
         assert handler.is_running is True
 
     @pytest.mark.asyncio
-    @patch("merobot.handler.channels.telegram.Application")
-    async def test_double_connect_is_noop(self, MockApplication, handler):
-        app_instance = AsyncMock()
-        app_instance.bot = AsyncMock()
-        app_instance.updater = AsyncMock()
-        app_instance.updater.start_polling = AsyncMock()
-
-        builder = MagicMock()
-        builder.token.return_value = builder
-        builder.build.return_value = app_instance
-        MockApplication.builder.return_value = builder
+    async def test_double_connect_is_noop(self, handler, mock_application):
+        builder, app_instance = mock_application
 
         await handler.connect()
         await handler.connect()  # should be a no-op
@@ -118,18 +118,9 @@ class TestConnect:
 
 class TestDisconnect:
     @pytest.mark.asyncio
-    @patch("merobot.handler.channels.telegram.Application")
-    async def test_disconnect_stops_app(self, MockApplication, handler):
-        app_instance = AsyncMock()
-        app_instance.bot = AsyncMock()
-        app_instance.updater = AsyncMock()
+    async def test_disconnect_stops_app(self, handler, mock_application):
+        builder, app_instance = mock_application
         app_instance.updater.running = True
-        app_instance.updater.start_polling = AsyncMock()
-
-        builder = MagicMock()
-        builder.token.return_value = builder
-        builder.build.return_value = app_instance
-        MockApplication.builder.return_value = builder
 
         await handler.connect()
         await handler.disconnect()
@@ -137,7 +128,6 @@ class TestDisconnect:
         app_instance.updater.stop.assert_awaited_once()
         app_instance.stop.assert_awaited_once()
         app_instance.shutdown.assert_awaited_once()
-        assert handler._connected is False
         assert handler.is_running is False
 
     @pytest.mark.asyncio
@@ -148,8 +138,9 @@ class TestDisconnect:
 class TestSendMessage:
     @pytest.mark.asyncio
     async def test_send_message_calls_bot(self, handler):
-        handler._connected = True
-        handler._bot = AsyncMock()
+        handler._bot = MagicMock(
+            spec=telegram.Bot, send_message=AsyncMock(), send_chat_action=AsyncMock()
+        )
 
         outbound = OutboundMessage(
             channel="telegram",
@@ -173,7 +164,7 @@ class TestSendMessage:
             recipient_id="1",
             chat_id="1",
         )
-        with pytest.raises(RuntimeError, match="not connected"):
+        with pytest.raises(RuntimeError, match=_NOT_CONNECTED):
             await handler.send_message(outbound)
 
 
@@ -220,8 +211,9 @@ class TestInboundPublishing:
 class TestTyping:
     @pytest.mark.asyncio
     async def test_start_typing_sends_action(self, handler):
-        handler._connected = True
-        handler._bot = AsyncMock()
+        handler._bot = MagicMock(
+            spec=telegram.Bot, send_message=AsyncMock(), send_chat_action=AsyncMock()
+        )
 
         await handler.start_typing("42")
 
@@ -235,43 +227,21 @@ class TestTyping:
 
     @pytest.mark.asyncio
     async def test_start_typing_raises_when_not_connected(self, handler):
-        with pytest.raises(RuntimeError, match="not connected"):
+        with pytest.raises(RuntimeError, match=_NOT_CONNECTED):
             await handler.start_typing("42")
 
 
 class TestMediaExtraction:
-    def test_extracts_photo(self):
-        msg = MagicMock()
-        photo_large = MagicMock()
-        photo_large.file_id = "photo_123"
-        msg.photo = [MagicMock(), photo_large]
-        msg.document = None
-        msg.video = None
-        msg.audio = None
-        msg.voice = None
-
-        result = TelegramChannelHandler._extract_media(msg)
-        assert result == ["photo_123"]
-
-    def test_extracts_document(self):
-        msg = MagicMock()
-        msg.photo = None
-        msg.document = MagicMock()
-        msg.document.file_id = "doc_456"
-        msg.video = None
-        msg.audio = None
-        msg.voice = None
-
-        result = TelegramChannelHandler._extract_media(msg)
-        assert result == ["doc_456"]
-
-    def test_no_media_returns_empty(self):
-        msg = MagicMock()
-        msg.photo = None
-        msg.document = None
-        msg.video = None
-        msg.audio = None
-        msg.voice = None
-
-        result = TelegramChannelHandler._extract_media(msg)
-        assert result == []
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            ({"photo": [MagicMock(), MagicMock(file_id="photo_123")]}, ["photo_123"]),
+            ({"document": MagicMock(file_id="doc_456")}, ["doc_456"]),
+            ({}, []),
+        ],
+        ids=["photo", "document", "no_media"],
+    )
+    def test_extract_media(self, overrides, expected):
+        msg = _blank_media_msg(**overrides)
+
+        assert TelegramChannelHandler._extract_media(msg) == expected
@@ -0,0 +1,64 @@
+"""Unit tests for ToolRegistry definition caching."""
+
+from typing import Any
+
+from merobot.agents.tools import ToolRegistry
+from merobot.tools.base import BaseTool
+
+
+class _EchoTool(BaseTool):
+    def __init__(self, name: str = "echo"):
+        self._name = name
+        self.schema_calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        self.schema_calls += 1
+        return "Echo the input back."
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {}}
+
+    async def execute(self, **kwargs: Any) -> str:
+        return "echo"
+
+
+class TestDefinitionCache:
+    def test_definitions_built_once(self):
+        registry = ToolRegistry()
+        tool = _EchoTool()
+        registry.register(tool)
+
+        first = registry.get_definitions()
+        second = registry.get_definitions()
+
+        assert first is second
+        assert tool.schema_calls == 1
+
+    def test_register_invalidates(self):
+        registry = ToolRegistry()
+        registry.register(_EchoTool("a"))
+        version = registry.version
+        registry.get_definitions()
+
+        registry.register(_EchoTool("b"))
+
+        assert registry.version != version
+        names = [d["function"]["name"] for d in registry.get_definitions()]
+        assert names == ["a", "b"]
+
+    def test_unregister_invalidates(self):
+        registry = ToolRegistry()
+        registry.register(_EchoTool("a"))
+        registry.register(_EchoTool("b"))
+        registry.get_definitions()
+
+        registry.unregister("a")
+
+        names = [d["function"]["name"] for d in registry.get_definitions()]
+        assert names == ["b"]
@@ -0,0 +1,243 @@
+"""Unit tests for WebScrapeTool extraction and report building."""
+
+import re
+import time
+
+import httpx
+import pytest
+
+from merobot.tools import web_scrape
+from merobot.tools.web_scrape import _LINE_BREAK_RE, WebScrapeTool
+
+_LENGTH_RE = re.compile(r"\*\*Length\*\*: (\d+) chars")
+
+
+def _pretty_table(rows: int) -> str:
+    """A pretty-printed page whose text nodes are mostly indentation."""
+    cells = "".join(
+        f"\n        <tr>\n            <td>\n                row {i}\n"
+        "            </td>\n        </tr>"
+        for i in range(rows)
+    )
+    return f"<html>\n<body>\n    <table>{cells}\n    </table>\n</body>\n</html>"
+
+
+def _report_length(report: str) -> int:
+    return int(_LENGTH_RE.search(report).group(1))
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    """Response body delivered as separate chunks, counting how many were read."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.read = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the tool's shared client to a handler; return the request log."""
+    requests: list[httpx.Request] = []
+
+    def install(handler):
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        monkeypatch.setattr(web_scrape, "get_http_client", lambda: client)
+        return requests
+
+    return install
+
+
+def _html_response(body: str = "<p>hello</p>", status: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status, headers={"content-type": "text/html; charset=utf-8"}, text=body
+    )
+
+
+class TestLineBreakRe:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("a  \n\n  b", "a\nb"),
+            ("a \t b", "a \t b"),
+            ("a\xa0\n\r\n b\n", "a\nb\n"),
+        ],
+    )
+    def test_collapses_runs_with_a_line_break(self, text, expected):
+        assert _LINE_BREAK_RE.sub("\n", text) == expected
+
+    def test_long_space_run_is_linear(self):
+        # 150k spaces took close to a minute with a backtracking pattern.
+        page = "<p>a" + " " * 150_000 + "b</p>"
+
+        start = time.perf_counter()
+        report = WebScrapeTool()._extract_full(page, "u", 20_000)
+
+        assert time.perf_counter() - start < 1.0
+        assert "truncated at 20000 characters" in report
+
+
+class TestBuildReport:
+    def test_indented_page_fills_max_length(self):
+        report = WebScrapeTool()._extract_full(_pretty_table(3000), "u", 5000)
+
+        assert _report_length(report) == 5000
+        assert "truncated at 5000 characters" in report
+
+    def test_prefix_matches_full_normalization(self):
+        text = ("  word  \n\n      " * 4000) + "end"
+        expected = _LINE_BREAK_RE.sub("\n", text).strip()[:500]
+
+        report = WebScrapeTool._build_report(text, "", "", "u", 500)
+
+        assert report.split("\n---\n\n", 1)[1].startswith(expected)
+
+    def test_whitespace_heavy_text_widens_to_whole_body(self):
+        # Every run collapses to "\n", so the prefix keeps widening until it
+        # covers all 4 MB; each pass must stay linear.
+        text = ("x" + " " * 40_000 + "\n") * 100
+
+        start = time.perf_counter()
+        report = WebScrapeTool._build_report(text, "", "", "u", 5000)
+
+        assert time.perf_counter() - start < 1.0
+        assert report.endswith("\n".join(["x"] * 100))
+        assert "truncated" not in report
+
+    def test_short_page_not_truncated(self):
+        report = WebScrapeTool()._extract_full(_pretty_table(3), "u", 5000)
+
+        assert "row 2" in report
+        assert "truncated" not in report
+
+
+class TestOptionalParsers:
+    """The "fast" extra's parsers must not change what the tool returns."""
+
+    _PAGES = [
+        (
+            "<html><head><title> Title </title>"
+            '<meta name="description" content=" About "><style>p{}</style></head>'
+            "<body><nav>menu<form>f</form></nav><p>Hello <b>bold</b> &amp;&nbsp;x</p>"
+            "<article>\n  <h1>A</h1>\n\n  <p>b   c</p>\n</article>"
+            "<script>var t;</script><footer>foot</footer></body></html>"
+        ),
+        "<p>no body <script>x</script> here</p>",
+        "",
+    ]
+
+    def test_lxml_used_when_installed(self):
+        pytest.importorskip("lxml")
+
+        assert web_scrape._PARSER == "lxml"
+
+    @pytest.mark.parametrize("page", [*_PAGES, _pretty_table(500)])
+    def test_selectolax_matches_beautifulsoup(self, monkeypatch, page):
+        pytest.importorskip("selectolax")
+        tool = WebScrapeTool()
+        fast = tool._extract_full(page, "u", 1000)
+
+        monkeypatch.setattr(web_scrape, "LexborHTMLParser", None)
+
+        assert tool._extract_full(page, "u", 1000) == fast
+
+
+class TestSelector:
+    _PAGE = (
+        "<html><head><script>var secret = 1;</script><style>.a{}</style></head>"
+        "<body><p>body text</p><script>var tracker;</script></body></html>"
+    )
+
+    @pytest.mark.parametrize("selector", ["script", "style", "*"])
+    def test_selector_never_returns_stripped_tags(self, selector):
+        report = WebScrapeTool()._extract_with_selector(
+            self._PAGE, "u", 5000, selector
+        )
+
+        assert "body text" in report
+        assert "secret" not in report
+        assert "tracker" not in report
+        assert ".a{}" not in report
+
+    def test_selector_targets_matching_elements(self):
+        page = "<body><nav>menu</nav><article>story</article><p>other</p></body>"
+
+        report = WebScrapeTool()._extract_with_selector(page, "u", 5000, "article")
+
+        assert report.endswith("story")
+
+
+class TestCache:
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(web_scrape.time, "monotonic", lambda: now[0])
+        tool = WebScrapeTool()
+        key = ("https://a.example", 5000, None)
+        tool._cache_put(key, "result")
+
+        now[0] += web_scrape.SCRAPE_CACHE_TTL - 1
+        assert tool._cache_get(key) == "result"
+
+        now[0] += 2
+        assert tool._cache_get(key) is None
+        assert key not in tool._cache
+
+    def test_least_recently_used_entry_evicted(self, monkeypatch):
+        monkeypatch.setattr(web_scrape, "SCRAPE_CACHE_MAX_ENTRIES", 2)
+        tool = WebScrapeTool()
+        a, b, c = (("https://" + host, 5000, None) for host in "abc")
+        tool._cache_put(a, "A")
+        tool._cache_put(b, "B")
+        tool._cache_get(a)  # a is now the most recently used
+
+        tool._cache_put(c, "C")
+
+        assert list(tool._cache) == [a, c]
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_are_not_cached(self, serve):
+        responses = iter([_html_response(status=500), _html_response()])
+        requests = serve(lambda request: next(responses))
+        tool = WebScrapeTool()
+
+        first = await tool.execute(url="https://a.example/")
+        second = await tool.execute(url="https://a.example/")
+        third = await tool.execute(url="https://a.example/")
+
+        assert first == "Error: HTTP 500 for 'https://a.example/'."
+        assert "hello" in second
+        assert third == second
+        assert len(requests) == 2
+
+
+class TestFetchPage:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("cap", "expected", "chunks_read"),
+        [(10, "abcdefghij", 3), (8, "abcdefgh", 2), (100, "abcdefghijklmnop", 4)],
+        ids=["mid_chunk", "chunk_boundary", "under_cap"],
+    )
+    async def test_body_capped_at_max_bytes(
+        self, serve, monkeypatch, cap, expected, chunks_read
+    ):
+        monkeypatch.setattr(web_scrape, "SCRAPE_MAX_RESPONSE_BYTES", cap)
+        stream = _ChunkStream([b"abcd", b"efgh", b"ijkl", b"mnop"])
+
+        def handler(request):
+            headers = {"content-type": "text/plain; charset=utf-8"}
+            return httpx.Response(200, headers=headers, stream=stream)
+
+        serve(handler)
+
+        html = await WebScrapeTool()._fetch_page("https://a.example/")
+
+        assert html == expected
+        assert stream.read == chunks_read
@@ -0,0 +1,137 @@
+"""Unit tests for WebSearchTool's DuckDuckGo HTML parsing."""
+
+import httpx
+import pytest
+
+from merobot.tools import web_search
+from merobot.tools.web_search import WebSearchTool, _iter_results, _strip_html
+
+_HREF_A = (
+    "//duckduckgo.com/l/?uddg="
+    "https%3A%2F%2Fexample.com%2Fsearch%3Fq%3Da%2Bb%26tag%3Dc+d&amp;rut=abc"
+)
+_HREF_C = "//duckduckgo.com/l/?uddg=https%3A%2F%2Fc.example%2F&amp;rut=z"
+
+# Trimmed DDG HTML endpoint page: the second result has no snippet, and the
+# first and third links go through DDG's redirect.
+_DDG_PAGE = f"""\
+<div class="serp__results">
+<div class="result results_links">
+  <h2 class="result__title">
+    <a rel="nofollow" class="result__a" href="{_HREF_A}">Example <b>A</b> &amp; co</a>
+  </h2>
+  <a class="result__snippet" href="x">Snippet <b>one</b> &quot;quoted&quot;</a>
+</div>
+<div class="result results_links">
+  <h2 class="result__title">
+    <a rel="nofollow" class="result__a" href="https://direct.example/b">B title</a>
+  </h2>
+</div>
+<div class="result results_links">
+  <h2 class="result__title">
+    <a rel="nofollow" class="result__a" href="{_HREF_C}">C</a>
+  </h2>
+  <a class="result__snippet" href="y">Snip <i>C</i></a>
+</div>
+</div>
+"""
+
+
+@pytest.fixture
+def ddg(monkeypatch):
+    """Serve _DDG_PAGE from the tool's shared client; return the request log."""
+    requests: list[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text=_DDG_PAGE)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(web_search, "get_http_client", lambda: client)
+    return requests
+
+
+class TestFetchResults:
+    @pytest.mark.asyncio
+    async def test_parses_results_in_order(self, ddg):
+        results = await WebSearchTool()._fetch_results("q", 10)
+
+        assert [r["title"] for r in results] == ["Example A & co", "B title", "C"]
+        assert ddg[0].method == "POST"
+
+    @pytest.mark.asyncio
+    async def test_snippet_pairs_with_its_own_result(self, ddg):
+        results = await WebSearchTool()._fetch_results("q", 10)
+
+        assert [r["snippet"] for r in results] == [
+            'Snippet one "quoted"',
+            "",
+            "Snip C",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_results(self, ddg):
+        results = await WebSearchTool()._fetch_results("q", 1)
+
+        assert len(results) == 1
+        assert results[0]["snippet"] == 'Snippet one "quoted"'
+
+    @pytest.mark.asyncio
+    async def test_unwraps_ddg_redirects(self, ddg):
+        results = await WebSearchTool()._fetch_results("q", 10)
+
+        # %2B decodes to "+", a literal "+" to a space (form encoding).
+        assert [r["url"] for r in results] == [
+            "https://example.com/search?q=a+b&tag=c d",
+            "https://direct.example/b",
+            "https://c.example/",
+        ]
+
+
+class TestIterResults:
+    def test_yields_titles_and_snippets(self):
+        items = list(_iter_results(_DDG_PAGE))
+
+        assert [href is None for href, _ in items] == [
+            False, True, False, False, True,
+        ]
+        assert items[1][1] == 'Snippet <b>one</b> &quot;quoted&quot;'
+
+    @pytest.mark.parametrize(
+        ("marker", "expected"),
+        [
+            ('href="https://direct', 2),  # inside an href: no closing quote
+            ('direct.example/b">', 2),  # opening tag never closed
+            ("B title</a>", 2),  # link text without </a>
+            ("</h2>\n</div>\n<div", 3),  # cut between rows
+        ],
+        ids=["href", "tag", "close", "between_rows"],
+    )
+    def test_truncated_page_keeps_complete_items(self, marker, expected):
+        # Cut just before the marker's last character.
+        cut = _DDG_PAGE.index(marker) + len(marker) - 1
+        items = list(_iter_results(_DDG_PAGE[:cut]))
+
+        assert len(items) == expected
+
+    def test_no_results(self):
+        assert list(_iter_results("<html><body>No results.</body></html>")) == []
+
+
+class TestStripHtml:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Example <b>A</b> &amp; co", "Example A & co"),
+            ("&lt;b&gt;literal&lt;/b&gt;", "<b>literal</b>"),
+            ("it&#39;s &#x27;quoted&#x27;", "it's 'quoted'"),
+            ("fish &amp chips", "fish & chips"),
+            ("a&nbsp;b", "a\xa0b"),
+            ("&bogus; stays", "&bogus; stays"),
+            ("  <i>padded</i>  ", "padded"),
+        ],
+        ids=["tag_and_amp", "escaped_tags", "numeric", "legacy", "nbsp",
+             "unknown", "strip"],
+    )
+    def test_strip_html(self, text, expected):
+        assert _strip_html(text) == expected